@@ -2,6 +2,7 @@
 
 # NOTE: Keep the public surface lightweight. Consumers can import submodules as needed.
 
+from .cache import ResponseCache
 from .registry import Registry
 from .interface import predict
 from .unified_client import UnifiedClient
@@ -10,4 +11,5 @@ __all__ = [
     "Registry",
     "predict",
     "UnifiedClient",
+    "ResponseCache",
 ]
@@ -0,0 +1,42 @@
+import os
+from typing import Optional
+
+from .provider import LLMProvider
+
+
+class AnthropicProvider(LLMProvider):
+    """Anthropic Messages API provider wrapper."""
+
+    name = "anthropic"
+
+    def __init__(self, api_key: Optional[str] = None, endpoint: Optional[str] = None, model: str = "claude-3-5-sonnet-latest", max_tokens: int = 1024):
+        super().__init__(name=self.name, api_key=(api_key or os.getenv("ANTHROPIC_API_KEY")), endpoint=(endpoint or "https://api.anthropic.com/v1/messages"))
+        self.model = model
+        self.max_tokens = max_tokens
+
+    def generate(self, system_prompt: str, user_input: str) -> str:
+        if not self.api_key:
+            raise RuntimeError("Anthropic API key not configured. Set ANTHROPIC_API_KEY env var or pass api_key.")
+        # The system prompt is the stable prefix across calls; mark it cacheable so
+        # repeated requests reuse the provider's prompt cache instead of re-billing it.
+        payload = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": 0.2,
+            "system": [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}},
+            ],
+            "messages": [{"role": "user", "content": user_input}],
+        }
+        headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json",
+        }
+        data = self._post_json(self.endpoint, payload, headers)
+        blocks = data.get("content") if isinstance(data, dict) else None
+        if isinstance(blocks, list):
+            text = "".join(b.get("text", "") for b in blocks if isinstance(b, dict) and b.get("type") == "text")
+            if text:
+                return text
+        raise ValueError("Invalid Anthropic response format")
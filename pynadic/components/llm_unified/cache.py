@@ -0,0 +1,147 @@
+"""Response caching helpers for llm_unified."""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+# Seconds between ts refreshes of a persisted entry served from memory
+_TOUCH_INTERVAL = 60
+
+
+class ResponseCache:
+    """In-memory LRU cache of raw provider outputs keyed by an exact prompt hash.
+
+    A hit lets the unified interface skip the provider round-trip entirely.
+    Only outputs that parsed successfully into the requested model are stored.
+    The cache is thread-safe, and inflight() lets concurrent identical requests
+    share a single provider call. When path is given, entries are also written to
+    a SQLite file so later processes can reuse them; the file keeps at most
+    max_rows entries, dropping the least recently used first.
+    """
+
+    def __init__(self, maxsize: int = 256, path: Optional[str] = None, max_rows: Optional[int] = 10000) -> None:
+        self.maxsize = maxsize
+        self.max_rows = max_rows
+        # key -> (value, last ts written to SQLite)
+        self._entries: "OrderedDict[str, Tuple[object, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, ts REAL NOT NULL)")
+            self._db.commit()
+        # key -> (per-key lock, number of callers holding or waiting on it)
+        self._inflight: Dict[str, Tuple[threading.Lock, int]] = {}
+
+    @staticmethod
+    def make_key(provider_name: str, model: Optional[str], system_prompt: str, user_input: str, schema: str = "") -> str:
+        """Return a stable digest for a (provider, model, prompt, output schema) request."""
+        h = hashlib.sha256()
+        for part in (provider_name, model or "", system_prompt, user_input, schema):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[object]:
+        """Return the cached value, marking it most recently used; SQLite hits are promoted into memory."""
+        with self._lock:
+            now = time.time()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                value, ts = self._entries[key]
+                # Refresh ts for pruning, at most once per interval to keep hits off the disk
+                if self._db is not None and now - ts >= _TOUCH_INTERVAL:
+                    self._touch(key, now)
+                    self._entries[key] = (value, now)
+                return value
+            if self._db is None:
+                return None
+            row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value = json.loads(row[0])
+            self._touch(key, now)
+            self._remember(key, value, now)
+            return value
+
+    def set(self, key: str, value: object) -> None:
+        with self._lock:
+            now = time.time()
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), now),
+                )
+                if self.max_rows is not None:
+                    self._db.execute(
+                        "DELETE FROM responses WHERE key NOT IN (SELECT key FROM responses ORDER BY ts DESC, rowid DESC LIMIT ?)",
+                        (self.max_rows,),
+                    )
+                self._db.commit()
+            self._remember(key, value, now)
+
+    def discard(self, key: str) -> None:
+        """Remove key from memory and, when persistent, from the SQLite store."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+
+    def _touch(self, key: str, now: float) -> None:
+        # Caller must hold self._lock and have checked self._db
+        self._db.execute("UPDATE responses SET ts = ? WHERE key = ?", (now, key))
+        self._db.commit()
+
+    def _remember(self, key: str, value: object, ts: float) -> None:
+        # Caller must hold self._lock
+        self._entries[key] = (value, ts)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @contextmanager
+    def inflight(self, key: str) -> Iterator[None]:
+        """Serialize callers working on the same key.
+
+        The first caller performs the request; later callers block until it finishes
+        and then find its result via get().
+        """
+        with self._lock:
+            lock, waiters = self._inflight.get(key, (threading.Lock(), 0))
+            self._inflight[key] = (lock, waiters + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, waiters = self._inflight[key]
+                if waiters == 1:
+                    del self._inflight[key]
+                else:
+                    self._inflight[key] = (lock, waiters - 1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["ResponseCache"]
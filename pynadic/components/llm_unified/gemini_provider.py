@@ -1,6 +1,5 @@
 import os
-from typing import Optional, Tuple, Dict
-import requests
+from typing import Optional, Dict, List
 
 
 from .provider import LLMProvider
@@ -17,7 +16,13 @@ class GeminiProvider(LLMProvider):
         self.max_tokens = max_tokens
         self.temperature = temperature
 
-    def generate(self, system_prompt: str, user_input: str) -> Tuple[str, Dict[str, Optional[int]]]:
+    def generate(self, system_prompt: str, user_input: str) -> str:
+        return self.generate_batch(system_prompt, user_input, 1)[0]
+
+    def generate_batch(self, system_prompt: str, user_input: str, n: int) -> List[str]:
+        """Sample n candidates in a single request; token usage is kept on _last_usage."""
+        if n < 1:
+            raise ValueError("n must be >= 1")
         if not self.api_key:
             raise RuntimeError("Google Gemini API key not configured. Set GOOGLE_GEMINI_API_KEY env var or pass api_key.")
         prompt_text = f"{system_prompt}\n{user_input}"
@@ -26,23 +31,24 @@ class GeminiProvider(LLMProvider):
             "temperature": self.temperature,
             "maxOutputTokens": self.max_tokens,
         }
+        if n > 1:
+            payload["candidateCount"] = n
         url = self.endpoint.format(model=self.model)
         headers = {"Content-Type": "application/json"}
         params = {"key": self.api_key}
-        resp = requests.post(url, json=payload, headers=headers, params=params, timeout=60)
-        resp.raise_for_status()
-        data = resp.json()
+        data = self._post_json(url, payload, headers, params=params)
         candidates = data.get("candidates") or []
-        text = ""
-        if candidates:
-            first = candidates[0]
-            if isinstance(first, dict):
-                text = first.get("content") or first.get("text") or first.get("output") or ""
-        if text is None:
+        texts = []
+        for candidate in candidates:
             text = ""
-        if text == "":
-            # Be strict here to surface API deviations clearly
-            raise ValueError("Invalid Gemini response format: no usable text found")
+            if isinstance(candidate, dict):
+                text = candidate.get("content") or candidate.get("text") or candidate.get("output") or ""
+            if not text:
+                # Be strict here to surface API deviations clearly
+                raise ValueError("Invalid Gemini response format: candidate without usable text")
+            texts.append(text)
+        if len(texts) != n:
+            raise ValueError(f"Invalid Gemini response format: expected {n} candidates, got {len(texts)}")
 
         # Usage extraction with a robust approach. Only store if at least one counter exists.
         usage: Dict[str, Optional[int]] = None  # type: ignore
@@ -77,4 +83,4 @@ class GeminiProvider(LLMProvider):
                     }
 
         self._last_usage = usage
-        return text, usage
+        return texts
@@ -1,13 +1,17 @@
-import json
+import logging
 from typing import List, Type, TypeVar, Optional
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+from .cache import ResponseCache
+from .provider import LLMProvider
 from .registry import Registry
 
+logger = logging.getLogger(__name__)
 
-def predict(system_prompt: str, user_input: str, output_model: Type[T], provider_names: List[str] | None = None, registry: Optional[Registry] = None) -> T:
+
+def predict(system_prompt: str, user_input: str, output_model: Type[T], provider_names: List[str] | None = None, registry: Optional[Registry] = None, cache: Optional[ResponseCache] = None) -> T:
     """Unified interface to generate structured output using multiple providers.
 
     - system_prompt: high-level instructions for the LLM.
@@ -15,6 +19,7 @@ def predict(system_prompt: str, user_input: str, output_model: Type[T], provider
     - output_model: a Pydantic model describing the desired schema.
     - provider_names: optional list[str] to specify provider order; defaults to OpenAI Responses API then Gemini.
     - registry: optional pre-configured Registry instance (for tests).
+    - cache: optional ResponseCache; identical requests are served without calling the provider.
     """
     reg = registry or Registry()
     providers = provider_names or ["openai_responses", "gemini"]
@@ -22,30 +27,62 @@ def predict(system_prompt: str, user_input: str, output_model: Type[T], provider
     last_error: Exception | None = None
     for name in providers:
         provider = reg.get_provider(name)
-        try:
-            content = provider.generate(system_prompt, user_input)
-        except Exception as exc:
-            last_error = exc
-            continue
-        # Normalize to JSON string using provider's helper when possible
-        try:
-            json_str = provider._ensure_json_string(content)
-        except Exception as exc:
-            last_error = exc
-            continue
-        # Try to parse JSON string into the provided Pydantic model
-        try:
-            return output_model.parse_raw(json_str)
-        except (ValidationError, json.JSONDecodeError, ValueError):
-            # Try an alternative parsing path: if json_str isn't a raw string but a JSON structure
+        if cache is None:
             try:
-                obj = json.loads(json_str)
-                return output_model.parse_obj(obj)
-            except Exception as ve:
-                last_error = ve
+                return _attempt(provider, system_prompt, user_input, output_model)
+            except Exception as exc:
+                last_error = exc
+                continue
+        schema = f"{output_model.__module__}.{output_model.__qualname__}"
+        key = ResponseCache.make_key(name, getattr(provider, "model", None), system_prompt, user_input, schema)
+        # Concurrent identical requests wait for the first one instead of re-issuing it
+        with cache.inflight(key):
+            try:
+                return _attempt(provider, system_prompt, user_input, output_model, cache, key)
+            except Exception as exc:
+                last_error = exc
                 continue
-        except Exception as ve:
-            last_error = ve
-            continue
 
     raise ValueError(f"Unable to parse output with provided providers. Last error: {last_error}")
+
+
+def _attempt(provider: LLMProvider, system_prompt: str, user_input: str, output_model: Type[T], cache: Optional[ResponseCache] = None, key: Optional[str] = None) -> T:
+    """Generate with a single provider and parse the payload into output_model; raise on failure."""
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.debug("Cache hit for provider %s", provider.name)
+            try:
+                result = _parse_payload(provider, cached, output_model)
+            except Exception as ve:
+                # A stale entry must not mask the provider; drop it and generate afresh
+                logger.debug("Discarding cached payload for provider %s: %s", provider.name, ve)
+                cache.discard(key)
+            else:
+                # get() already refreshed the in-memory entry; writing back would hit SQLite
+                return result
+    try:
+        content = provider.generate(system_prompt, user_input)
+    except Exception as exc:
+        logger.debug("Provider %s failed to generate: %s", provider.name, exc)
+        raise
+    try:
+        result = _parse_payload(provider, content, output_model)
+    except Exception as ve:
+        logger.debug("Provider %s output failed validation: %s", provider.name, ve)
+        raise
+    if cache is not None:
+        # Caching is best-effort; a write failure must not discard a valid result
+        try:
+            cache.set(key, content)
+        except Exception as exc:
+            logger.debug("Failed to cache payload for provider %s: %s", provider.name, exc)
+    return result
+
+
+def _parse_payload(provider: LLMProvider, content: object, output_model: Type[T]) -> T:
+    """Validate a provider payload into output_model."""
+    # Normalize to JSON string using provider's helper when possible
+    json_str = provider._ensure_json_string(content)
+    # Parse the JSON string into the provided Pydantic model
+    return output_model.model_validate_json(json_str)
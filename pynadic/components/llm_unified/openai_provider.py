@@ -1,7 +1,5 @@
-import json
 import os
-from typing import Optional
-import requests
+from typing import List, Optional
 
 from .provider import LLMProvider
 
@@ -16,6 +14,12 @@ class OpenAIProvider(LLMProvider):
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
 
     def generate(self, system_prompt: str, user_input: str) -> str:
+        return self.generate_batch(system_prompt, user_input, 1)[0]
+
+    def generate_batch(self, system_prompt: str, user_input: str, n: int) -> List[str]:
+        """Sample n completions in a single request so the prompt is only prefilled once."""
+        if n < 1:
+            raise ValueError("n must be >= 1")
         if not self.api_key:
             raise RuntimeError("OpenAI API key not configured. Set OPENAI_API_KEY or provide via constructor.")
         messages = [
@@ -23,15 +27,22 @@ class OpenAIProvider(LLMProvider):
             {"role": "user", "content": user_input},
         ]
         payload = {"model": self.model, "messages": messages, "temperature": 0.2}
+        if n > 1:
+            payload["n"] = n
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-        resp = requests.post(self.endpoint, json=payload, headers=headers, timeout=60)
-        resp.raise_for_status()
-        data = resp.json()
-        try:
-            return data["choices"][0]["message"]["content"]
-        except Exception:
-            if isinstance(data, dict) and data.get("choices") and isinstance(data["choices"], list):
-                c = data["choices"][0]
-                if isinstance(c, dict) and "text" in c:
-                    return c["text"]
+        data = self._post_json(self.endpoint, payload, headers)
+        choices = data.get("choices") if isinstance(data, dict) else None
+        if not isinstance(choices, list) or len(choices) != n:
+            raise ValueError("Invalid OpenAI response format")
+        return [self._choice_text(c) for c in choices]
+
+    @staticmethod
+    def _choice_text(choice: object) -> str:
+        """Return a choice's text; a null or non-string content (e.g. a refusal) is a format error."""
+        if isinstance(choice, dict):
+            message = choice.get("message")
+            if isinstance(message, dict) and isinstance(message.get("content"), str):
+                return message["content"]
+            if isinstance(choice.get("text"), str):
+                return choice["text"]
         raise ValueError("Invalid OpenAI response format")
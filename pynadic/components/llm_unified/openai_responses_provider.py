@@ -1,6 +1,5 @@
 import os
 from typing import Optional
-import requests
 
 from .provider import LLMProvider
 
@@ -17,22 +16,32 @@ class OpenAIResponsesProvider(LLMProvider):
     def generate(self, system_prompt: str, user_input: str) -> str:
         if not self.api_key:
             raise RuntimeError("OpenAI Responses API key not configured. Set OPENAI_API_KEY env var or pass api_key.")
-        prompt = f"{system_prompt}\n\n{user_input}"
+        # Keep the system prompt in its own field ahead of the per-call input so the
+        # provider sees an identical prefix across calls and can reuse its prompt cache.
         payload = {
             "model": self.model,
-            "prompt": prompt,
-            "max_tokens": 1024,
+            "instructions": system_prompt,
+            "input": user_input,
+            "max_output_tokens": 1024,
             "temperature": 0.2,
         }
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        resp = requests.post(self.endpoint, json=payload, headers=headers, timeout=60)
-        resp.raise_for_status()
-        data = resp.json()
+        data = self._post_json(self.endpoint, payload, headers)
         # Normalize common shapes
         if isinstance(data, dict):
+            # Responses API: message items carrying output_text parts
+            output = data.get("output")
+            if isinstance(output, list):
+                parts = [
+                    part.get("text", "")
+                    for item in output if isinstance(item, dict)
+                    for part in (item.get("content") or []) if isinstance(part, dict) and part.get("type") == "output_text"
+                ]
+                if parts:
+                    return "".join(parts)
             # OpenAI style with choices
             choices = data.get("choices")
             if isinstance(choices, list) and choices:
@@ -43,12 +52,12 @@ class OpenAIResponsesProvider(LLMProvider):
                         msg = first["message"].get("content")
                     if not msg:
                         msg = first.get("content") or first.get("text")
-                    if msg is not None:
+                    if isinstance(msg, str):
                         return msg
             # Direct completion
-            if "completion" in data:
+            if isinstance(data.get("completion"), str):
                 return data["completion"]
-            if "text" in data:
+            if isinstance(data.get("text"), str):
                 return data["text"]
         elif isinstance(data, str):
             return data
@@ -1,15 +1,96 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 import json
+import math
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding of request and response bodies
+    orjson = None
+
+# At least one request must be allowed in flight, or every provider call would block forever
+_MAX_INFLIGHT = max(1, int(os.getenv("LLM_UNIFIED_MAX_INFLIGHT", "8")))
+_MAX_RETRIES = max(0, int(os.getenv("LLM_UNIFIED_MAX_RETRIES", "3")))
+# Rate limiting and transient server errors; anything else is surfaced immediately
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _strip_code_fence(text: str) -> str:
+    """Return the body of a ```/```json fenced block, or text unchanged if it is not fenced.
+    Models often wrap JSON this way; unwrapping avoids failing validation and falling
+    through to the next provider.
+    """
+    stripped = text.strip()
+    if not stripped.startswith("```") or not stripped.endswith("```") or len(stripped) < 6:
+        return text
+    first_newline = stripped.find("\n")
+    if first_newline == -1:
+        return text
+    return stripped[first_newline + 1:-3].strip()
+
+
+def _retry_delay(resp: requests.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: the server's Retry-After if given, else 2**attempt capped at 30
+    plus up to as much again in random jitter, so clients throttled together do not retry in lockstep.
+    Retry-After values that are not finite numbers (including HTTP dates) fall back to the backoff.
+    """
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = math.nan
+        if math.isfinite(delay):
+            return min(max(0.0, delay), 30.0)
+    backoff = float(min(2 ** attempt, 30))
+    return backoff + random.uniform(0, backoff)
+
+
+def _new_session() -> requests.Session:
+    """Return a session whose connection pool matches the in-flight cap.
+    Keeping connections alive avoids a TCP+TLS handshake on every request, and sizing the
+    pool to the cap means concurrent callers never open throwaway sockets.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_MAX_INFLIGHT)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class LLMProvider(ABC):
     """Base class for all LLM providers used by the unified interface."""
 
+    # Caps concurrent HTTP requests across all providers in the process, so callers
+    # fanning out over threads queue locally instead of tripping provider rate limits.
+    _inflight = threading.BoundedSemaphore(_MAX_INFLIGHT)
+
     def __init__(self, name: str, api_key: Optional[str] = None, endpoint: Optional[str] = None):
         self.name = name
         self.api_key = api_key
         self.endpoint = endpoint
+        # Built eagerly so threads sharing a provider never race to create it
+        self._session = _new_session()
 
     @abstractmethod
     def generate(self, system_prompt: str, user_input: str) -> str:
@@ -18,20 +99,45 @@ class LLMProvider(ABC):
         """
         raise NotImplementedError
 
+    def generate_batch(self, system_prompt: str, user_input: str, n: int) -> List[str]:
+        """Return n sampled payloads for the same prompt.
+        The default issues n independent calls; providers that can sample several
+        candidates in one request should override this.
+        """
+        if n < 1:
+            raise ValueError("n must be >= 1")
+        return [self.generate(system_prompt, user_input) for _ in range(n)]
+
+    def _post_json(self, url: str, payload: dict, headers: Dict[str, str], params: Optional[Dict[str, str]] = None) -> object:
+        """POST payload as JSON and return the decoded JSON response.
+        The body is pre-encoded once with _dumps rather than by requests' stdlib encoder.
+        Rate-limited or transiently failing requests are retried with exponential backoff;
+        the in-flight slot is released while waiting so other callers can proceed.
+        """
+        body = _dumps(payload)
+        for attempt in range(_MAX_RETRIES + 1):
+            with LLMProvider._inflight:
+                resp = self._session.post(url, data=body, headers=headers, params=params, timeout=60)
+            if resp.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                break
+            time.sleep(_retry_delay(resp, attempt))
+        resp.raise_for_status()
+        return _loads(resp.content)
+
     def __repr__(self) -> str:
         return f"<LLMProvider name={self.name}>"
 
     @staticmethod
     def _ensure_json_string(payload: object) -> str:
         """Coerce a provider output to a JSON string.
-        - If payload is a string, return it directly.
-        - If payload is a dict or list, serialize using json.dumps.
+        - If payload is a string, return it directly, unwrapping a Markdown code fence if present.
+        - If payload is a dict or list, serialize it to JSON.
         - Otherwise, raise ValueError.
         """
         if isinstance(payload, str):
-            return payload
+            return _strip_code_fence(payload)
         try:
-            return json.dumps(payload)
+            return _dumps(payload).decode("utf-8")
         except Exception as exc:
             raise ValueError(f"Unable to serialize provider output to JSON: {exc}") from exc
 
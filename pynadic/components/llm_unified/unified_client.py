@@ -4,6 +4,7 @@ from typing import Optional, Type
 
 from pydantic import BaseModel
 
+from .cache import ResponseCache
 from .registry import Registry
 from .interface import predict as _predict
 
@@ -11,12 +12,14 @@ from .interface import predict as _predict
 class UnifiedClient:
     """A lightweight, stateful wrapper around the unified LLM interface.
 
-    It holds a Registry instance (defaulting to a fresh Registry) and delegates the
-    actual prediction work to the shared 'predict' function defined in llm_unified.interface.
+    It holds a Registry instance (defaulting to a fresh Registry) and an optional
+    ResponseCache, and delegates the actual prediction work to the shared 'predict'
+    function defined in llm_unified.interface.
     """
 
-    def __init__(self, registry: Optional[Registry] = None):
+    def __init__(self, registry: Optional[Registry] = None, cache: Optional[ResponseCache] = None):
         self._registry = registry or Registry()
+        self._cache = cache
 
     def predict(self, system_prompt: str, user_input: str, output_model: Type[BaseModel], provider_names: Optional[list[str]] = None) -> BaseModel:
         """Infer a structured output by querying the configured providers in order.
@@ -27,7 +30,7 @@ class UnifiedClient:
         - provider_names: optional list of provider names to try in order (e.g. ["openai_responses", "gemini"]).
         - Returns an instance of output_model populated with parsed data.
         """
-        return _predict(system_prompt, user_input, output_model, provider_names, self._registry)
+        return _predict(system_prompt, user_input, output_model, provider_names, self._registry, self._cache)
 
 
 __all__ = ["UnifiedClient"]
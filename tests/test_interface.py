@@ -0,0 +1,97 @@
+"""Tests for predict() fallback and response caching."""
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from pynadic.components.llm_unified import ResponseCache, Registry, predict
+from pynadic.components.llm_unified.provider import LLMProvider
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class CountingProvider(LLMProvider):
+    """Returns a fixed payload and counts calls; optionally blocks until released."""
+
+    def __init__(self, name: str, payload: str, release: threading.Event | None = None) -> None:
+        super().__init__(name=name)
+        self.payload = payload
+        self.release = release
+        self.started = threading.Event()
+        self.calls = 0
+
+    def generate(self, system_prompt: str, user_input: str) -> str:
+        self.calls += 1
+        self.started.set()
+        if self.release is not None:
+            assert self.release.wait(5)
+        return self.payload
+
+
+def cache_key(provider: LLMProvider, output_model: type) -> str:
+    schema = f"{output_model.__module__}.{output_model.__qualname__}"
+    return ResponseCache.make_key(provider.name, getattr(provider, "model", None), "sys", "user", schema)
+
+
+def test_falls_back_to_next_provider() -> None:
+    bad = CountingProvider("bad", "not json")
+    good = CountingProvider("good", '{"value": 2}')
+    result = predict("sys", "user", Answer, provider_names=["bad", "good"], registry=Registry([bad, good]))
+    assert result == Answer(value=2)
+    assert (bad.calls, good.calls) == (1, 1)
+
+
+def test_cache_hit_skips_provider() -> None:
+    provider = CountingProvider("p", '{"value": 1}')
+    cache = ResponseCache()
+    reg = Registry([provider])
+    for _ in range(2):
+        assert predict("sys", "user", Answer, provider_names=["p"], registry=reg, cache=cache) == Answer(value=1)
+    assert provider.calls == 1
+
+
+def test_concurrent_identical_requests_share_one_call() -> None:
+    release = threading.Event()
+    provider = CountingProvider("p", '{"value": 3}', release)
+    cache = ResponseCache()
+    reg = Registry([provider])
+    results = []
+
+    def run() -> None:
+        results.append(predict("sys", "user", Answer, provider_names=["p"], registry=reg, cache=cache))
+
+    first = threading.Thread(target=run)
+    first.start()
+    assert provider.started.wait(5)
+    second = threading.Thread(target=run)
+    second.start()
+    # Release the first call only once the second caller is queued on the same key
+    key = cache_key(provider, Answer)
+    deadline = time.monotonic() + 5
+    while cache._inflight.get(key, (None, 0))[1] < 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert results == [Answer(value=3), Answer(value=3)]
+    assert provider.calls == 1
+    assert cache._inflight == {}
+
+
+@pytest.mark.parametrize("persistent", [False, True])
+def test_stale_cache_entry_falls_back_to_provider(tmp_path, persistent: bool) -> None:
+    provider = CountingProvider("p", '{"value": 4}')
+    cache = ResponseCache(path=str(tmp_path / "cache.db") if persistent else None)
+    key = cache_key(provider, Answer)
+    cache.set(key, '{"unexpected": true}')
+
+    result = predict("sys", "user", Answer, provider_names=["p"], registry=Registry([provider]), cache=cache)
+
+    assert result == Answer(value=4)
+    assert provider.calls == 1
+    assert cache.get(key) == '{"value": 4}'
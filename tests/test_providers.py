@@ -0,0 +1,103 @@
+"""Tests for the llm_unified provider request/response handling."""
+import json
+from typing import List
+from unittest import mock
+
+import pytest
+
+from pynadic.components.llm_unified.gemini_provider import GeminiProvider
+from pynadic.components.llm_unified.openai_provider import OpenAIProvider
+from pynadic.components.llm_unified.provider import LLMProvider
+
+
+class EchoProvider(LLMProvider):
+    def __init__(self) -> None:
+        super().__init__(name="echo")
+        self.calls = 0
+
+    def generate(self, system_prompt: str, user_input: str) -> str:
+        self.calls += 1
+        return user_input
+
+
+def fake_response(body: object, status: int = 200, headers: dict | None = None) -> mock.Mock:
+    resp = mock.Mock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    resp.content = json.dumps(body).encode("utf-8")
+    resp.raise_for_status = mock.Mock()
+    return resp
+
+
+def sent_payload(post: mock.Mock) -> dict:
+    return json.loads(post.call_args.kwargs["data"])
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_generate_batch_rejects_non_positive_n(n: int) -> None:
+    echo = EchoProvider()
+    with mock.patch("requests.Session.post") as post:
+        for provider in (echo, OpenAIProvider(api_key="k"), GeminiProvider(api_key="k")):
+            with pytest.raises(ValueError, match="n must be >= 1"):
+                provider.generate_batch("sys", "user", n)
+    post.assert_not_called()
+    assert echo.calls == 0
+
+
+def test_default_generate_batch_calls_generate_n_times() -> None:
+    echo = EchoProvider()
+    assert echo.generate_batch("sys", "hi", 3) == ["hi", "hi", "hi"]
+    assert echo.calls == 3
+
+
+def test_openai_generate_batch_samples_in_one_request() -> None:
+    body = {"choices": [{"message": {"content": "a"}}, {"message": {"content": "b"}}]}
+    with mock.patch("requests.Session.post", return_value=fake_response(body)) as post:
+        texts: List[str] = OpenAIProvider(api_key="k").generate_batch("sys", "user", 2)
+    assert texts == ["a", "b"]
+    assert post.call_count == 1
+    assert sent_payload(post)["n"] == 2
+
+
+def test_openai_generate_batch_rejects_short_or_null_batches() -> None:
+    provider = OpenAIProvider(api_key="k")
+    short = {"choices": [{"message": {"content": "a"}}]}
+    null = {"choices": [{"message": {"content": None}}]}
+    with mock.patch("requests.Session.post", return_value=fake_response(short)):
+        with pytest.raises(ValueError):
+            provider.generate_batch("sys", "user", 2)
+    with mock.patch("requests.Session.post", return_value=fake_response(null)):
+        with pytest.raises(ValueError):
+            provider.generate("sys", "user")
+
+
+def test_gemini_generate_batch_requests_candidate_count() -> None:
+    body = {"candidates": [{"output": "a"}, {"output": "b"}], "usage": {"promptTokens": "3", "completionTokens": 4.0}}
+    provider = GeminiProvider(api_key="k")
+    with mock.patch("requests.Session.post", return_value=fake_response(body)) as post:
+        assert provider.generate_batch("sys", "user", 2) == ["a", "b"]
+    assert sent_payload(post)["candidateCount"] == 2
+    assert provider._last_usage == {"input_tokens": 3, "output_tokens": 4}
+
+
+def test_post_json_retries_rate_limited_requests() -> None:
+    body = {"choices": [{"message": {"content": "ok"}}]}
+    responses = [fake_response({}, 429), fake_response({}, 503, {"Retry-After": "2"}), fake_response(body)]
+    with mock.patch("requests.Session.post", side_effect=responses) as post, \
+            mock.patch("pynadic.components.llm_unified.provider.time.sleep") as sleep, \
+            mock.patch("pynadic.components.llm_unified.provider.random.uniform", return_value=0.5):
+        assert OpenAIProvider(api_key="k").generate("sys", "user") == "ok"
+    assert post.call_count == 3
+    # Backoff of 2**0 plus jitter, then the server's Retry-After
+    assert [c.args[0] for c in sleep.call_args_list] == [1.5, 2.0]
+
+
+def test_post_json_gives_up_after_max_retries() -> None:
+    with mock.patch("requests.Session.post", return_value=fake_response({}, 429)) as post, \
+            mock.patch("pynadic.components.llm_unified.provider.time.sleep"), \
+            mock.patch("pynadic.components.llm_unified.provider._MAX_RETRIES", 2):
+        resp = post.return_value
+        resp.raise_for_status.side_effect = RuntimeError("429")
+        with pytest.raises(RuntimeError):
+            OpenAIProvider(api_key="k").generate("sys", "user")
+    assert post.call_count == 3